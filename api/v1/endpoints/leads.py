@@ -4,7 +4,7 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import or_, asc, desc, nulls_first, nulls_last
+from sqlalchemy import Select, or_, asc, desc, nulls_first, nulls_last
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select, update, delete, text, func
 from db.sql import get_session
@@ -54,6 +54,49 @@ def build_query_filter(model: Lead) -> Optional[str]:
     query_condition = model.search_vector.op('@@')(text("plainto_tsquery('english', :query)"))
     return query_condition
 
+def build_leads_where_clause(query: str):
+    """Helper to build the search condition shared by the listing statements."""
+    query_condition = build_query_filter(Lead)
+    email_condition = Lead.email.like(f"%{query.lower()}%")
+    return or_(query_condition, email_condition)
+
+def build_leads_statement(query: str, sort_by: Optional[str]) -> Select:
+    """Helper to build the filtered and sorted leads select, callers add their own limit."""
+    stmt = select(*lead_public_fields)
+
+    if query:
+        stmt = stmt.where(build_leads_where_clause(query)).params(query=query)
+
+    sort_expressions = build_sorting_expression(sort_by=sort_by, model=Lead)
+    return stmt.order_by(*sort_expressions)
+
+def build_leads_count_statement(query: str) -> Select:
+    """Helper to build the total count statement for listing leads."""
+    stmt = select(func.count()).select_from(Lead)
+
+    if query:
+        stmt = stmt.where(build_leads_where_clause(query)).params(query=query)
+
+    return stmt
+
+def build_lead_statement(lead_id: int) -> Select:
+    """Helper to build the statement fetching a single lead."""
+    return select(Lead).where(Lead.id == lead_id)
+
+def get_warmup_statements() -> List[Select]:
+    """Statements behind the hottest read endpoints, executed on startup so
+    every pooled connection already has them prepared.
+
+    Limit and offset are bound parameters, so a limit of 0 compiles to the
+    same SQL as a real page while returning no rows. The count statements are
+    left out since they would scan the table on every deploy.
+    """
+    return [
+        build_leads_statement(query="", sort_by=None).limit(0).offset(0),
+        build_leads_statement(query="warmup", sort_by=None).limit(0).offset(0),
+        build_lead_statement(0),
+    ]
+
 @router.get("/", response_model=PaginationResponse[LeadPublic])
 async def get_leads(
     session: AsyncSession=Depends(get_session),
@@ -65,19 +108,8 @@ async def get_leads(
     try:
         query = query.strip()
         offset = (page - 1) * page_size
-        stmt = select(*lead_public_fields)
-        total_count_stmt = select(func.count()).select_from(Lead)
-
-        if query:
-            query_condition = build_query_filter(Lead)
-            email_condition = Lead.email.like(f"%{query.lower()}%")
-            where_clause = or_(query_condition, email_condition)
-
-            stmt = stmt.where(where_clause).params(query=query)
-            total_count_stmt = total_count_stmt.where(where_clause).params(query=query)
-
-        sort_expressions = build_sorting_expression(sort_by=sort_by, model=Lead)
-        stmt = stmt.order_by(*sort_expressions).limit(page_size).offset(offset)
+        stmt = build_leads_statement(query=query, sort_by=sort_by).limit(page_size).offset(offset)
+        total_count_stmt = build_leads_count_statement(query=query)
 
         results = await session.execute(stmt)
 
@@ -108,18 +140,8 @@ async def export_leads(
 ):
     try:
         query = query.strip()
-        stmt = select(*lead_public_fields)
         CSV_ROW_LIMIT = 10000
-
-        if query:
-            query_condition = build_query_filter(Lead)
-            email_condition = Lead.email.like(f"%{query.lower()}%")
-            where_clause = or_(query_condition, email_condition)
-
-            stmt = stmt.where(where_clause).params(query=query)
-
-        sort_expressions = build_sorting_expression(sort_by, Lead)
-        stmt = stmt.order_by(*sort_expressions).limit(CSV_ROW_LIMIT)
+        stmt = build_leads_statement(query=query, sort_by=sort_by).limit(CSV_ROW_LIMIT)
 
         result = await session.execute(stmt)
         
@@ -158,7 +180,7 @@ async def create_lead(lead_create: LeadCreate, session: AsyncSession=Depends(get
 @router.get("/{lead_id}", response_model=LeadPublic)
 async def get_lead(lead_id: int, session: AsyncSession=Depends(get_session)):
     try:
-        stmt = select(Lead).where(Lead.id == lead_id)
+        stmt = build_lead_statement(lead_id)
         result = await session.execute(stmt)
         lead = result.scalars().first()
         
@@ -10,6 +10,12 @@ class Settings(BaseSettings):
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "postgres"
     DB_URL: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_WARMUP_CONNECTIONS: int = 5
+    DB_WARMUP_TIMEOUT: float = 10.0
+    DB_READY_TIMEOUT: float = 1.0
+    DB_READY_CACHE_TTL: float = 2.0
 
     class Config:
         env_file = ".env"
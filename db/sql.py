@@ -1,16 +1,37 @@
-from typing import AsyncIterator
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlmodel import SQLModel
+from sqlalchemy.sql import Executable
+from sqlmodel import SQLModel, text
 from config import settings
+from utils.logger import logger
 
 
 DB_URL = settings.DB_URL
-engine = create_async_engine(DB_URL, echo=True)
+engine = create_async_engine(
+    DB_URL,
+    echo=settings.DEBUG_MODE,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+# Readiness pings use their own single persistent connection so they do not
+# queue behind request handlers when the main pool is exhausted.
+ping_engine = create_async_engine(
+    DB_URL,
+    pool_size=1,
+    max_overflow=0,
+    pool_pre_ping=True,
+    pool_timeout=settings.DB_READY_TIMEOUT,
+)
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+_ready_state: Dict[str, Any] = {"ready": False, "checked_at": None}
+_ready_lock: Optional[asyncio.Lock] = None
+
 async def init_db():
     async with engine.begin() as conn:
         # Create all tables
@@ -18,4 +39,91 @@ async def init_db():
 
 async def get_session() -> AsyncIterator[AsyncSession]:
     async with async_session() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def warm_up_pool(statements: List[Executable], connections: int, progress: Dict[str, int]) -> int:
+    """Open pool connections up front and run the hot statements on each.
+
+    asyncpg keeps a prepared statement cache per connection, so executing the
+    statements here moves type introspection and statement preparation out of
+    the first real requests. Connections are warmed concurrently and every one
+    that finishes is counted in progress["warmed_connections"], so callers can
+    still report partial progress if they time the warm-up out.
+    Returns the number of connections warmed up.
+    """
+    progress.setdefault("warmed_connections", 0)
+    connections = max(0, min(connections, settings.DB_POOL_SIZE))
+    if not connections:
+        return 0
+
+    # Every slot holds its connection until all slots have tried to connect,
+    # otherwise the pool would keep handing back the same one.
+    pending = connections
+    all_connected = asyncio.Event()
+
+    def _arrive():
+        nonlocal pending
+        pending -= 1
+        if not pending:
+            all_connected.set()
+
+    async def _warm() -> bool:
+        arrived = False
+        try:
+            async with engine.connect() as conn:
+                _arrive()
+                arrived = True
+                await all_connected.wait()
+
+                async with async_session(bind=conn) as session:
+                    for stmt in statements:
+                        await session.execute(stmt)
+                    await session.rollback()
+            progress["warmed_connections"] += 1
+            return True
+        except Exception as e:
+            if not arrived:
+                _arrive()
+            logger.warning(f"Could not warm up connection ==> {e!r}")
+            return False
+
+    results = await asyncio.gather(*[_warm() for _ in range(connections)])
+    return sum(results)
+
+async def _ping_db(timeout: float) -> bool:
+    async def _ping():
+        async with ping_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.wait_for(_ping(), timeout=timeout)
+        return True
+    except Exception as e:
+        logger.warning(f"Database ping failed ==> {e!r}")
+        return False
+
+async def is_db_ready() -> bool:
+    """Check database reachability, caching the result for a short while so
+    frequent readiness probes do not each cost a round trip."""
+    global _ready_lock
+
+    if not _ready_state_expired():
+        return _ready_state["ready"]
+
+    # Created lazily so the lock belongs to the running event loop.
+    if _ready_lock is None:
+        _ready_lock = asyncio.Lock()
+
+    async with _ready_lock:
+        # Another probe may have refreshed the state while we were waiting.
+        if not _ready_state_expired():
+            return _ready_state["ready"]
+
+        _ready_state["ready"] = await _ping_db(settings.DB_READY_TIMEOUT)
+        _ready_state["checked_at"] = time.monotonic()
+
+    return _ready_state["ready"]
+
+def _ready_state_expired() -> bool:
+    checked_at = _ready_state["checked_at"]
+    return checked_at is None or time.monotonic() - checked_at >= settings.DB_READY_CACHE_TTL
@@ -1,12 +1,44 @@
-from fastapi import FastAPI
+from utils.startup import IMPORT_STARTED_AT
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, status
 from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from api.v1.endpoints import leads
+from db.sql import engine, ping_engine, is_db_ready, warm_up_pool
 from utils.exceptions import BaseAppException
 from utils.logger import logger
 from config import settings
 
-app = FastAPI(title=settings.APP_NAME, debug=True)
+IMPORT_DURATION = time.perf_counter() - IMPORT_STARTED_AT
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup_started_at = time.perf_counter()
+    warmup_progress = {"warmed_connections": 0}
+    try:
+        await asyncio.wait_for(
+            warm_up_pool(leads.get_warmup_statements(), settings.DB_WARMUP_CONNECTIONS, warmup_progress),
+            timeout=settings.DB_WARMUP_TIMEOUT
+        )
+    except Exception as e:
+        # Do not block startup, /ready reports the database state.
+        logger.warning(f"Database warm-up failed ==> {e!r}")
+
+    app.state.startup_timings = {
+        "import_seconds": round(IMPORT_DURATION, 4),
+        "warmup_seconds": round(time.perf_counter() - warmup_started_at, 4),
+        "warmed_connections": warmup_progress["warmed_connections"],
+    }
+    logger.info(f"Startup timings ==> {app.state.startup_timings}")
+
+    yield
+
+    await engine.dispose()
+    await ping_engine.dispose()
+
+app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG_MODE, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -43,6 +75,15 @@ async def redirect_to_docs():
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/ready")
+async def readiness_check():
+    if not await is_db_ready():
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable"}
+        )
+    return {"status": "ready"}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=False)
@@ -0,0 +1,149 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from db import sql
+
+
+@pytest.fixture(autouse=True)
+def reset_ready_state(monkeypatch):
+    monkeypatch.setattr(sql, "_ready_state", {"ready": False, "checked_at": None})
+    monkeypatch.setattr(sql, "_ready_lock", None)
+    monkeypatch.setattr(sql.settings, "DB_READY_CACHE_TTL", 2.0)
+
+
+def patch_ping(monkeypatch, results):
+    calls = []
+
+    async def fake_ping(timeout):
+        calls.append(timeout)
+        await asyncio.sleep(0.01)
+        return results[len(calls) - 1]
+
+    monkeypatch.setattr(sql, "_ping_db", fake_ping)
+    return calls
+
+
+def patch_clock(monkeypatch, now):
+    # Replace only db.sql's view of the clock, asyncio still needs the real one.
+    monkeypatch.setattr(sql, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+
+def test_concurrent_ready_checks_ping_once(monkeypatch):
+    calls = patch_ping(monkeypatch, [True])
+
+    async def check():
+        return await asyncio.gather(*[sql.is_db_ready() for _ in range(10)])
+
+    assert asyncio.run(check()) == [True] * 10
+    assert len(calls) == 1
+
+
+def test_ready_result_is_cached_within_ttl(monkeypatch):
+    calls = patch_ping(monkeypatch, [True, True])
+    now = [100.0]
+    patch_clock(monkeypatch, now)
+
+    assert asyncio.run(sql.is_db_ready()) is True
+    now[0] += 1.9
+    assert asyncio.run(sql.is_db_ready()) is True
+    assert len(calls) == 1
+
+    now[0] += 0.1
+    assert asyncio.run(sql.is_db_ready()) is True
+    assert len(calls) == 2
+
+
+def test_ready_failure_is_cached_then_retried(monkeypatch):
+    calls = patch_ping(monkeypatch, [False, True])
+    now = [100.0]
+    patch_clock(monkeypatch, now)
+
+    assert asyncio.run(sql.is_db_ready()) is False
+    now[0] += 1.0
+    assert asyncio.run(sql.is_db_ready()) is False
+    assert len(calls) == 1
+
+    now[0] += 1.0
+    assert asyncio.run(sql.is_db_ready()) is True
+    assert len(calls) == 2
+
+
+def test_first_ready_check_pings_on_fresh_clock(monkeypatch):
+    calls = patch_ping(monkeypatch, [True])
+    patch_clock(monkeypatch, [0.5])
+
+    assert asyncio.run(sql.is_db_ready()) is True
+    assert len(calls) == 1
+
+
+class FakeConnection:
+    def __init__(self, fail, slow, log):
+        self.fail = fail
+        self.slow = slow
+        self.log = log
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise OSError("connection refused")
+        self.log["open"] += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.log["closed"] += 1
+
+
+class FakeSession:
+    def __init__(self, bind):
+        self.bind = bind
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def execute(self, delay):
+        await asyncio.sleep(5 if self.bind.slow else delay)
+
+    async def rollback(self):
+        pass
+
+
+def patch_engine(monkeypatch, failing_slots=(), slow_slots=()):
+    log = {"open": 0, "closed": 0, "attempts": 0}
+
+    def connect():
+        log["attempts"] += 1
+        slot = log["attempts"]
+        return FakeConnection(slot in failing_slots, slot in slow_slots, log)
+
+    monkeypatch.setattr(sql, "engine", SimpleNamespace(connect=connect))
+    monkeypatch.setattr(sql, "async_session", FakeSession)
+    monkeypatch.setattr(sql.settings, "DB_POOL_SIZE", 5)
+    return log
+
+
+def test_warm_up_pool_survives_failed_slot(monkeypatch):
+    log = patch_engine(monkeypatch, failing_slots=(3,))
+    progress = {}
+
+    warmed = asyncio.run(sql.warm_up_pool([0.01], 5, progress))
+
+    assert warmed == 4
+    assert progress["warmed_connections"] == 4
+    assert log["open"] == log["closed"] == 4
+
+
+def test_warm_up_pool_timeout_closes_connections_and_keeps_progress(monkeypatch):
+    log = patch_engine(monkeypatch, slow_slots=(4, 5))
+    progress = {"warmed_connections": 0}
+
+    async def warm_up():
+        await asyncio.wait_for(sql.warm_up_pool([0.01], 5, progress), timeout=0.2)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(warm_up())
+
+    assert progress["warmed_connections"] == 3
+    assert log["open"] == log["closed"] == 5
@@ -0,0 +1,4 @@
+import time
+
+# Imported first by main so the time spent importing the app can be measured.
+IMPORT_STARTED_AT = time.perf_counter()